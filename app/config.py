@@ -1,27 +1,36 @@
 """Configuration management using environment variables."""
 import os
+from dataclasses import dataclass, field, fields
+from functools import cache
 from dotenv import load_dotenv
 
 # Load .env file
 load_dotenv()
 
 
+@dataclass(frozen=True, slots=True)
 class Settings:
     """Application settings loaded from environment variables."""
 
     # OpenAI Configuration
-    OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "")
-    OPENAI_MODEL: str = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
+    OPENAI_API_KEY: str = ""
+    OPENAI_MODEL: str = "gpt-4o-mini"
 
     # MCP / RapidAPI Configuration
-    RAPIDAPI_KEY: str = os.getenv("RAPIDAPI_KEY", "")
-    RAPIDAPI_HOST: str = os.getenv("RAPIDAPI_HOST", "irctc1.p.rapidapi.com")
-    MCP_SERVER_URL: str = os.getenv("MCP_SERVER_URL", "https://mcp.rapidapi.com")
-    MCP_PROTOCOL_VERSION: str = "2025-03-26"
+    RAPIDAPI_KEY: str = ""
+    RAPIDAPI_HOST: str = "irctc1.p.rapidapi.com"
+    MCP_SERVER_URL: str = "https://mcp.rapidapi.com"
+    MCP_PROTOCOL_VERSION: str = field(
+        default="2025-03-26", metadata={"env": False}
+    )
+    MCP_TOOLS_CACHE_PATH: str = os.path.expanduser(
+        "~/.cache/rail-chatbot-backend/mcp_tools.json"
+    )
+    MCP_TOOLS_CACHE_TTL: int = 86400  # Seconds; 0 disables the disk cache
 
     # Server Configuration
-    HOST: str = os.getenv("HOST", "0.0.0.0")
-    PORT: int = int(os.getenv("PORT", "8000"))
+    HOST: str = "0.0.0.0"
+    PORT: int = 8000
 
     def validate(self) -> bool:
         """Validate that required settings are present."""
@@ -32,4 +41,15 @@ class Settings:
         return True
 
 
-settings = Settings()
+@cache
+def get_settings() -> Settings:
+    """Build the settings once, overriding field defaults from the environment."""
+    overrides = {}
+    for f in fields(Settings):
+        value = os.getenv(f.name)
+        if value is not None and f.metadata.get("env", True):
+            overrides[f.name] = f.type(value)
+    return Settings(**overrides)
+
+
+settings = get_settings()
@@ -1,7 +1,8 @@
 """OpenAI LLM Client with tool calling support."""
-import json
 import logging
-from typing import Any, Optional, Union
+from typing import Any, AsyncGenerator, Optional, Union
+
+import orjson
 from openai import AsyncOpenAI
 
 from app.config import settings
@@ -25,8 +26,9 @@ class TextResponse(LlmResponse):
 class ToolCallsResponse(LlmResponse):
     """LLM requested tool calls."""
 
-    def __init__(self, tool_calls: list[ToolCall]):
+    def __init__(self, tool_calls: list[ToolCall], text: str = ""):
         self.tool_calls = tool_calls
+        self.text = text  # Text streamed alongside the tool calls, if any
 
 
 class LlmError(LlmResponse):
@@ -56,109 +58,175 @@ If a tool returns an error, explain it to the user in a friendly way."""
 
     def __init__(self):
         self._client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+        # (source tool list, converted payload); McpClient hands out the
+        # same list for the whole session so an identity check suffices
+        self._tools_cache: Optional[tuple[list[McpTool], list[dict]]] = None
 
     async def chat(
         self,
         messages: list[ChatMessage],
         tools: Optional[list[McpTool]] = None,
-    ) -> Union[TextResponse, ToolCallsResponse, LlmError]:
+        openai_messages_cache: Optional[list[dict[str, Any]]] = None,
+    ) -> AsyncGenerator[Union[str, TextResponse, ToolCallsResponse, LlmError], None]:
         """
-        Send a chat request to OpenAI.
+        Send a streaming chat request to OpenAI.
 
         Args:
             messages: Conversation history
             tools: Available tools (MCP tools converted to OpenAI format)
-
-        Returns:
-            TextResponse if LLM returns text,
+            openai_messages_cache: Optional list owned by the caller holding
+                the already converted messages. Since the history only grows,
+                just the messages not yet in the cache are converted and
+                appended to it.
+
+        Yields:
+            str for each text delta as it arrives, then exactly one of
+            TextResponse with the full text,
             ToolCallsResponse if LLM wants to call tools,
             LlmError if something went wrong
         """
         try:
-            # Build OpenAI messages
-            openai_messages = [
-                {"role": "system", "content": self.SYSTEM_PROMPT}
-            ]
-
-            for msg in messages:
-                openai_msg: dict[str, Any] = {
-                    "role": msg.role.value,
-                    "content": msg.content,
-                }
-                if msg.tool_call_id:
-                    openai_msg["tool_call_id"] = msg.tool_call_id
-                # Include tool_calls for assistant messages
-                if msg.tool_calls:
-                    openai_msg["tool_calls"] = [
-                        {
-                            "id": tc.id,
-                            "type": "function",
-                            "function": {
-                                "name": tc.name,
-                                "arguments": json.dumps(tc.arguments),
-                            },
-                        }
-                        for tc in msg.tool_calls
-                    ]
-                openai_messages.append(openai_msg)
+            # Build OpenAI messages, converting only what is not cached yet
+            openai_messages = (
+                openai_messages_cache
+                if openai_messages_cache is not None
+                else []
+            )
+            if not openai_messages:
+                openai_messages.append(
+                    {"role": "system", "content": self.SYSTEM_PROMPT}
+                )
+
+            # The first cached entry is the system prompt
+            converted = len(openai_messages) - 1
+            openai_messages.extend(
+                self._to_openai_message(msg) for msg in messages[converted:]
+            )
 
             # Build tools in OpenAI format
-            openai_tools = None
-            if tools:
-                openai_tools = [
-                    {
-                        "type": "function",
-                        "function": {
-                            "name": tool.name,
-                            "description": tool.description or tool.name,
-                            "parameters": tool.input_schema or {"type": "object", "properties": {}},
-                        },
-                    }
-                    for tool in tools
-                ]
+            openai_tools = self._get_openai_tools(tools)
 
             # Make the API call
-            logger.debug(f"Sending {len(openai_messages)} messages to OpenAI")
+            logger.debug("Sending %s messages to OpenAI", len(openai_messages))
 
-            response = await self._client.chat.completions.create(
+            stream = await self._client.chat.completions.create(
                 model=settings.OPENAI_MODEL,
                 messages=openai_messages,
                 tools=openai_tools,
                 tool_choice="auto" if openai_tools else None,
+                stream=True,
             )
 
-            choice = response.choices[0]
-            message = choice.message
+            text_parts: list[str] = []
+            # Tool calls arrive as fragments keyed by their index
+            tool_call_parts: dict[int, dict[str, Any]] = {}
+
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta
+
+                if delta.content:
+                    text_parts.append(delta.content)
+                    yield delta.content
+
+                for tc in delta.tool_calls or ():
+                    parts = tool_call_parts.setdefault(
+                        tc.index, {"id": "", "name": "", "arguments": []}
+                    )
+                    if tc.id:
+                        parts["id"] = tc.id
+                    if tc.function:
+                        if tc.function.name:
+                            parts["name"] += tc.function.name
+                        if tc.function.arguments:
+                            parts["arguments"].append(tc.function.arguments)
 
             # Check if LLM wants to call tools
-            if message.tool_calls:
+            if tool_call_parts:
                 tool_calls = []
-                for tc in message.tool_calls:
+                for index in sorted(tool_call_parts):
+                    parts = tool_call_parts[index]
+
                     # Parse arguments from JSON string
+                    arguments_json = "".join(parts["arguments"])
                     try:
-                        args = json.loads(tc.function.arguments)
-                    except json.JSONDecodeError:
+                        args = orjson.loads(arguments_json)
+                    except orjson.JSONDecodeError:
+                        args = None
+                    if not isinstance(args, dict):
                         args = {}
+                        arguments_json = None
 
                     tool_calls.append(
                         ToolCall(
-                            id=tc.id,
-                            name=tc.function.name,
+                            id=parts["id"],
+                            name=parts["name"],
                             arguments=args,
+                            arguments_json=arguments_json,
                         )
                     )
 
-                logger.info(f"LLM requested {len(tool_calls)} tool calls")
-                return ToolCallsResponse(tool_calls)
+                logger.info("LLM requested %s tool calls", len(tool_calls))
+                yield ToolCallsResponse(tool_calls, "".join(text_parts))
+                return
 
             # LLM returned text
-            text = message.content or ""
-            logger.debug(f"LLM returned text response: {text[:100]}...")
-            return TextResponse(text)
+            text = "".join(text_parts)
+            logger.debug("LLM returned text response: %s...", text[:100])
+            yield TextResponse(text)
 
         except Exception as e:
-            logger.error(f"LLM error: {e}")
-            return LlmError(str(e), e)
+            logger.error("LLM error: %s", e)
+            yield LlmError(str(e), e)
+
+    @staticmethod
+    def _to_openai_message(msg: ChatMessage) -> dict[str, Any]:
+        """Convert a chat message to OpenAI format."""
+        openai_msg: dict[str, Any] = {
+            "role": msg.role.value,
+            "content": msg.content,
+        }
+        if msg.tool_call_id:
+            openai_msg["tool_call_id"] = msg.tool_call_id
+        # Include tool_calls for assistant messages
+        if msg.tool_calls:
+            openai_msg["tool_calls"] = [
+                {
+                    "id": tc.id,
+                    "type": "function",
+                    "function": {
+                        "name": tc.name,
+                        "arguments": tc.arguments_json or orjson.dumps(tc.arguments).decode(),
+                    },
+                }
+                for tc in msg.tool_calls
+            ]
+        return openai_msg
+
+    def _get_openai_tools(
+        self, tools: Optional[list[McpTool]]
+    ) -> Optional[list[dict]]:
+        """Convert MCP tools to OpenAI format, reusing the last conversion."""
+        if not tools:
+            return None
+
+        if self._tools_cache and self._tools_cache[0] is tools:
+            return self._tools_cache[1]
+
+        openai_tools = [
+            {
+                "type": "function",
+                "function": {
+                    "name": tool.name,
+                    "description": tool.description or tool.name,
+                    "parameters": tool.input_schema or {"type": "object", "properties": {}},
+                },
+            }
+            for tool in tools
+        ]
+        self._tools_cache = (tools, openai_tools)
+        return openai_tools
 
     def build_tool_result_message(
         self, tool_call_id: str, result: str
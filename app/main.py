@@ -1,23 +1,39 @@
 """FastAPI application with SSE streaming endpoint."""
-import json
+import atexit
 import logging
+import queue
 from contextlib import asynccontextmanager
+from logging.handlers import QueueHandler, QueueListener
 
-from fastapi import FastAPI, HTTPException
+import msgspec
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import StreamingResponse
 
 from app.config import settings
-from app.models import ChatRequest, OrchestratorEvent
+from app.models import ERROR, ChatRequest, OrchestratorEvent
 from app.orchestrator import ChatOrchestrator
 
-# Configure logging
+# Configure logging. Records are formatted by the QueueHandler and written
+# to stderr by a background listener thread, off the event loop.
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    handlers=[QueueHandler(_log_queue)],
 )
+_log_listener = QueueListener(_log_queue, logging.StreamHandler())
+_log_listener.start()
+# Stop (and flush) the listener only at process exit: the app's lifespan can
+# run more than once per process, e.g. under tests
+atexit.register(_log_listener.stop)
 logger = logging.getLogger(__name__)
 
+# SSE framing, pre-encoded so frames are assembled as bytes
+_SSE_PREFIX = b"data: "
+_SSE_SUFFIX = b"\n\n"
+
 # Global orchestrator instance
 orchestrator: ChatOrchestrator = None
 
@@ -34,10 +50,20 @@ async def lifespan(app: FastAPI):
     try:
         settings.validate()
     except ValueError as e:
-        logger.error(f"Configuration error: {e}")
+        logger.error("Configuration error: %s", e)
         raise
 
     orchestrator = ChatOrchestrator()
+
+    # Warm up MCP so the first chat request does not pay for the handshake.
+    # Failures are not fatal: requests retry initialization on demand.
+    try:
+        await orchestrator.mcp_client.initialize()
+        tools = await orchestrator.mcp_client.list_tools()
+        logger.info("MCP ready with %s tools", len(tools))
+    except Exception as e:
+        logger.warning("MCP warm-up failed, will retry on first request: %s", e)
+
     logger.info("Backend started successfully")
 
     yield
@@ -64,6 +90,26 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# /api/chat decodes its body with msgspec, so FastAPI does not know the
+# request schema; publish the msgspec-generated one in the OpenAPI document
+(_CHAT_REQUEST_SCHEMA,), _CHAT_SCHEMA_COMPONENTS = msgspec.json.schema_components(
+    (ChatRequest,), ref_template="#/components/schemas/{name}"
+)
+_default_openapi = app.openapi
+
+
+def _openapi():
+    """Build the OpenAPI document, adding the msgspec model schemas."""
+    if app.openapi_schema is None:
+        schema = _default_openapi()
+        schema.setdefault("components", {}).setdefault("schemas", {}).update(
+            _CHAT_SCHEMA_COMPONENTS
+        )
+    return app.openapi_schema
+
+
+app.openapi = _openapi
+
 
 @app.get("/health")
 async def health_check():
@@ -71,8 +117,16 @@ async def health_check():
     return {"status": "healthy", "service": "rail-chatbot-backend"}
 
 
-@app.post("/api/chat")
-async def chat(request: ChatRequest):
+@app.post(
+    "/api/chat",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": _CHAT_REQUEST_SCHEMA}},
+        }
+    },
+)
+async def chat(request: Request):
     """
     Process a chat message and stream events via SSE.
 
@@ -87,23 +141,33 @@ async def chat(request: ChatRequest):
     if not orchestrator:
         raise HTTPException(status_code=503, detail="Service not ready")
 
+    # Decode the body with msgspec rather than FastAPI's pydantic validation
+    try:
+        chat_request = msgspec.json.decode(
+            await request.body(), type=ChatRequest
+        )
+    except msgspec.DecodeError as e:
+        # Same 422 error shape FastAPI produces for its own body validation
+        raise RequestValidationError(
+            [{"loc": ("body",), "msg": str(e), "type": "value_error"}]
+        )
+
     async def event_generator():
         """Generate SSE events from the orchestrator."""
         try:
             async for event in orchestrator.process_message(
-                request.message, request.history
+                chat_request.message, chat_request.history
             ):
                 # Format as SSE
-                event_json = event.model_dump_json()
-                yield f"data: {event_json}\n\n"
+                yield _SSE_PREFIX + msgspec.json.encode(event) + _SSE_SUFFIX
 
         except Exception as e:
-            logger.exception(f"Error in event generator: {e}")
+            logger.exception("Error in event generator: %s", e)
             error_event = OrchestratorEvent(
-                type="error",
+                type=ERROR,
                 text=f"Server error: {e}",
             )
-            yield f"data: {error_event.model_dump_json()}\n\n"
+            yield _SSE_PREFIX + msgspec.json.encode(error_event) + _SSE_SUFFIX
 
     return StreamingResponse(
         event_generator(),
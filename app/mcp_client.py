@@ -1,13 +1,29 @@
 """MCP Client for communicating with the Railway MCP server via JSON-RPC 2.0."""
+import asyncio
+import itertools
 import logging
+import os
+import tempfile
+import time
 from typing import Any, Optional
 import httpx
+import msgspec
+import orjson
 
 from app.config import settings
 from app.models import McpTool, McpToolResult, McpContent
 
 logger = logging.getLogger(__name__)
 
+# Bound once at import so per-request paths skip the settings lookups
+MCP_SERVER_URL = settings.MCP_SERVER_URL
+RAPIDAPI_HOST = settings.RAPIDAPI_HOST
+RAPIDAPI_KEY = settings.RAPIDAPI_KEY
+PROTO = settings.MCP_PROTOCOL_VERSION
+
+# Tool lists are only reused from disk for the same server/protocol/API
+TOOLS_CACHE_KEY = [MCP_SERVER_URL, PROTO, RAPIDAPI_HOST]
+
 
 class McpException(Exception):
     """Exception for MCP protocol errors."""
@@ -27,11 +43,34 @@ class McpClient:
     CLIENT_VERSION = "1.0.0"
 
     def __init__(self):
-        self._request_id = 0
+        self._request_id = itertools.count(1)
         self._is_initialized = False
         self._session_id: Optional[str] = None
         self._cached_tools: list[McpTool] = []
-        self._http_client = httpx.AsyncClient(timeout=60.0)
+        # Strong references to fire-and-forget tasks until they finish
+        self._background_tasks: set[asyncio.Task] = set()
+        # Serializes the handshake when concurrent tool calls initialize lazily
+        self._init_lock = asyncio.Lock()
+        # Invariant headers are set once on the client; httpx merges them
+        # into every request so only the session id is passed per call
+        self._base_headers = {
+            "Content-Type": "application/json",
+            "x-api-host": RAPIDAPI_HOST,
+            "x-api-key": RAPIDAPI_KEY,
+            "MCP-Protocol-Version": PROTO,
+        }
+        # HTTP/2 lets concurrent tool calls share one connection to the
+        # MCP host instead of queueing behind each other
+        self._http_client = httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(60.0, connect=5.0),
+            limits=httpx.Limits(
+                max_keepalive_connections=50,
+                max_connections=100,
+                keepalive_expiry=120,
+            ),
+            headers=self._base_headers,
+        )
 
     async def initialize(self) -> None:
         """Initialize connection to the MCP server."""
@@ -39,43 +78,54 @@ class McpClient:
             logger.debug("MCP client already initialized")
             return
 
-        params = {
-            "protocolVersion": settings.MCP_PROTOCOL_VERSION,
-            "capabilities": {"tools": {}},
-            "clientInfo": {
-                "name": self.CLIENT_NAME,
-                "version": self.CLIENT_VERSION,
-            },
-        }
+        async with self._init_lock:
+            # Another caller may have finished the handshake while we waited
+            if self._is_initialized:
+                return
 
-        response = await self._send_request("initialize", params)
+            params = {
+                "protocolVersion": PROTO,
+                "capabilities": {"tools": {}},
+                "clientInfo": {
+                    "name": self.CLIENT_NAME,
+                    "version": self.CLIENT_VERSION,
+                },
+            }
 
-        if "error" in response:
-            raise McpException(
-                response["error"].get("code", -1),
-                response["error"].get("message", "Unknown error"),
-            )
+            response = await self._send_request("initialize", params)
+
+            if "error" in response:
+                raise self._rpc_error(response["error"])
+
+            self._is_initialized = True
 
-        # Send initialized notification
-        await self._send_notification("notifications/initialized")
+            # Send initialized notification without waiting on the round-trip;
+            # MCP servers accept it arriving after the first requests
+            task = asyncio.create_task(
+                self._send_notification("notifications/initialized")
+            )
+            self._background_tasks.add(task)
+            task.add_done_callback(self._background_tasks.discard)
 
-        self._is_initialized = True
-        logger.info("MCP client initialized successfully")
+            logger.info("MCP client initialized successfully")
 
     async def list_tools(self) -> list[McpTool]:
         """List available tools from the MCP server."""
-        await self._ensure_initialized()
-
         if self._cached_tools:
             return self._cached_tools
 
+        disk_tools = self._load_tools_from_disk()
+        if disk_tools:
+            self._cached_tools = disk_tools
+            logger.info("Loaded %s tools from disk cache", len(self._cached_tools))
+            return self._cached_tools
+
+        await self._ensure_initialized()
+
         response = await self._send_request("tools/list", None)
 
         if "error" in response:
-            raise McpException(
-                response["error"].get("code", -1),
-                response["error"].get("message", "Unknown error"),
-            )
+            raise self._rpc_error(response["error"])
 
         result = response.get("result", {})
         tools_array = result.get("tools", [])
@@ -89,34 +139,69 @@ class McpClient:
             for tool in tools_array
         ]
 
-        logger.info(f"Fetched {len(self._cached_tools)} tools")
+        logger.info("Fetched %s tools", len(self._cached_tools))
+        self._save_tools_to_disk(self._cached_tools)
         return self._cached_tools
 
     async def call_tool(
         self, name: str, arguments: dict[str, Any]
     ) -> McpToolResult:
-        """Call a tool on the MCP server."""
-        await self._ensure_initialized()
+        """
+        Call a tool on the MCP server.
 
-        # Convert arguments to strings where needed (MCP expects strings)
-        string_args = {
-            k: str(v) if v is not None else None for k, v in arguments.items()
-        }
+        Failures (JSON-RPC errors, transport errors, malformed replies) are
+        returned as an McpToolResult with is_error set rather than raised,
+        mirroring how the server reports tool-level errors.
+        """
+        try:
+            return await self._call_tool(name, arguments)
+        except (McpException, httpx.HTTPError, orjson.JSONDecodeError) as e:
+            return self._error_result(name, str(e))
+        except Exception as e:
+            # A bug rather than a tool failure: keep the traceback in the logs
+            return self._error_result(name, str(e), exc_info=True)
+
+    async def _call_tool(
+        self, name: str, arguments: dict[str, Any]
+    ) -> McpToolResult:
+        """Call a tool, returning JSON-RPC errors as an error result."""
+        if not isinstance(arguments, dict):
+            return self._error_result(name, "Tool arguments must be an object")
+
+        # Convert arguments to strings where needed (MCP expects strings).
+        # LLM arguments are usually strings already, so reuse the dict as-is
+        # then; it is only read from here on.
+        if all(isinstance(v, str) or v is None for v in arguments.values()):
+            string_args = arguments
+        else:
+            string_args = {
+                k: str(v) if v is not None else None
+                for k, v in arguments.items()
+            }
 
         params = {"name": name, "arguments": string_args}
 
-        logger.info(f"Calling tool: {name} with args: {arguments}")
+        logger.info("Calling tool: %s with args: %s", name, arguments)
 
+        await self._ensure_initialized()
         response = await self._send_request("tools/call", params)
 
+        if not isinstance(response, dict):
+            return self._error_result(name, "Malformed MCP response")
+
         if "error" in response:
-            raise McpException(
-                response["error"].get("code", -1),
-                response["error"].get("message", "Unknown error"),
+            return self._error_result(
+                name, self._rpc_error_message(response["error"])
             )
 
         result = response.get("result", {})
-        content_array = result.get("content", [])
+        content_array = (
+            result.get("content", []) if isinstance(result, dict) else None
+        )
+        if not isinstance(content_array, list) or not all(
+            isinstance(content, dict) for content in content_array
+        ):
+            return self._error_result(name, "Malformed MCP response")
 
         contents = [
             McpContent(
@@ -130,6 +215,31 @@ class McpClient:
 
         return McpToolResult(content=contents, is_error=is_error)
 
+    @staticmethod
+    def _rpc_error_message(error: Any) -> str:
+        """Message of a JSON-RPC error member of any shape."""
+        if isinstance(error, dict):
+            return str(error.get("message", "Unknown error"))
+        return str(error)
+
+    @classmethod
+    def _rpc_error(cls, error: Any) -> McpException:
+        """Build an McpException from a JSON-RPC error member of any shape."""
+        code = error.get("code", -1) if isinstance(error, dict) else -1
+        return McpException(code, cls._rpc_error_message(error))
+
+    @staticmethod
+    def _error_result(
+        name: str, message: str, exc_info: bool = False
+    ) -> McpToolResult:
+        """Build an error result for a tool call that could not complete."""
+        text = f"Tool execution failed: {message}"
+        logger.error("Tool %s failed: %s", name, message, exc_info=exc_info)
+        return McpToolResult(
+            content=[McpContent(type="text", text=text)],
+            is_error=True,
+        )
+
     def is_connected(self) -> bool:
         """Check if the client is connected and initialized."""
         return self._is_initialized
@@ -139,6 +249,8 @@ class McpClient:
         self._is_initialized = False
         self._session_id = None
         self._cached_tools = []
+        if self._background_tasks:
+            await asyncio.gather(*self._background_tasks)
         await self._http_client.aclose()
 
     async def _ensure_initialized(self) -> None:
@@ -146,39 +258,94 @@ class McpClient:
         if not self._is_initialized:
             await self.initialize()
 
+    def _load_tools_from_disk(self) -> Optional[list[McpTool]]:
+        """Load the tool list from the disk cache if it is fresh and matches."""
+        if settings.MCP_TOOLS_CACHE_TTL <= 0:
+            return None
+
+        try:
+            with open(settings.MCP_TOOLS_CACHE_PATH, "rb") as f:
+                # Only trust a file written by this user; anyone else could
+                # plant tool names and descriptions that reach the LLM
+                if os.fstat(f.fileno()).st_uid != os.getuid():
+                    logger.warning("Ignoring tools cache owned by another user")
+                    return None
+                data = orjson.loads(f.read())
+        except FileNotFoundError:
+            return None
+        except (OSError, orjson.JSONDecodeError) as e:
+            logger.warning("Ignoring unreadable tools cache: %s", e)
+            return None
+
+        try:
+            if data["key"] != TOOLS_CACHE_KEY:
+                return None
+            # A timestamp in the future (clock skew, tampering) is stale too
+            age = time.time() - data["fetched_at"]
+            if not 0 <= age <= settings.MCP_TOOLS_CACHE_TTL:
+                return None
+            return msgspec.convert(data["tools"], list[McpTool])
+        except Exception as e:
+            logger.warning("Ignoring invalid tools cache: %s", e)
+            return None
+
+    def _save_tools_to_disk(self, tools: list[McpTool]) -> None:
+        """Persist the tool list so restarts can skip tools/list."""
+        if settings.MCP_TOOLS_CACHE_TTL <= 0 or not tools:
+            return
+
+        data = {
+            "key": TOOLS_CACHE_KEY,
+            "fetched_at": time.time(),
+            "tools": msgspec.to_builtins(tools),
+        }
+        # Write to a temp file next to the cache and swap it in, so other
+        # workers never read a partially written file
+        path = settings.MCP_TOOLS_CACHE_PATH
+        tmp_path = None
+        try:
+            os.makedirs(os.path.dirname(path) or ".", mode=0o700, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(
+                dir=os.path.dirname(path) or ".",
+                prefix=os.path.basename(path) + ".",
+            )
+            with os.fdopen(fd, "wb") as f:
+                f.write(orjson.dumps(data))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning("Failed to write tools cache: %s", e)
+            if tmp_path:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+
     async def _send_request(
         self, method: str, params: Optional[dict[str, Any]]
     ) -> dict[str, Any]:
         """Send a JSON-RPC request to the MCP server."""
-        self._request_id += 1
-
         request_body = {
             "jsonrpc": "2.0",
-            "id": self._request_id,
+            "id": next(self._request_id),
             "method": method,
         }
         if params is not None:
             request_body["params"] = params
 
-        headers = {
-            "Content-Type": "application/json",
-            "x-api-host": settings.RAPIDAPI_HOST,
-            "x-api-key": settings.RAPIDAPI_KEY,
-            "MCP-Protocol-Version": settings.MCP_PROTOCOL_VERSION,
-        }
-        if self._session_id:
-            headers["Mcp-Session-Id"] = self._session_id
-
-        logger.debug(f"Sending MCP request: {method}")
+        logger.debug("Sending MCP request: %s", method)
 
         response = await self._http_client.post(
-            settings.MCP_SERVER_URL,
-            json=request_body,
-            headers=headers,
+            MCP_SERVER_URL,
+            content=orjson.dumps(request_body),
+            headers=(
+                {"Mcp-Session-Id": self._session_id}
+                if self._session_id
+                else None
+            ),
         )
 
-        response_data = response.json()
-        logger.debug(f"MCP response: {response_data}")
+        response_data = orjson.loads(response.content)
+        logger.debug("MCP response: %s", response_data)
 
         return response_data
 
@@ -189,20 +356,15 @@ class McpClient:
             "method": method,
         }
 
-        headers = {
-            "Content-Type": "application/json",
-            "x-api-host": settings.RAPIDAPI_HOST,
-            "x-api-key": settings.RAPIDAPI_KEY,
-            "MCP-Protocol-Version": settings.MCP_PROTOCOL_VERSION,
-        }
-        if self._session_id:
-            headers["Mcp-Session-Id"] = self._session_id
-
         try:
             await self._http_client.post(
-                settings.MCP_SERVER_URL,
-                json=request_body,
-                headers=headers,
+                MCP_SERVER_URL,
+                content=orjson.dumps(request_body),
+                headers=(
+                {"Mcp-Session-Id": self._session_id}
+                if self._session_id
+                else None
+            ),
             )
         except Exception as e:
-            logger.warning(f"Failed to send notification: {e}")
+            logger.warning("Failed to send notification: %s", e)
@@ -1,7 +1,8 @@
-"""Pydantic models for the chat backend."""
+"""msgspec models for the chat backend."""
 from enum import Enum
-from typing import Any, Optional
-from pydantic import BaseModel
+from typing import Any, Literal, Optional
+
+import msgspec
 
 
 class MessageRole(str, Enum):
@@ -12,7 +13,7 @@ class MessageRole(str, Enum):
     TOOL = "tool"
 
 
-class ChatMessage(BaseModel):
+class ChatMessage(msgspec.Struct):
     """A message in the conversation."""
     role: MessageRole
     content: str
@@ -20,51 +21,60 @@ class ChatMessage(BaseModel):
     tool_calls: Optional[list["ToolCall"]] = None  # For assistant messages with tool calls
 
 
-class ChatRequest(BaseModel):
+class ChatRequest(msgspec.Struct):
     """Request to the chat endpoint."""
     message: str
-    history: list[ChatMessage] = []
+    history: list[ChatMessage] = msgspec.field(default_factory=list)
 
 
-class ToolCall(BaseModel):
+class ToolCall(msgspec.Struct):
     """A tool call made by the LLM."""
     id: str
     name: str
     arguments: dict[str, Any]
+    arguments_json: Optional[str] = None  # Raw JSON arguments from the LLM
 
 
-class McpTool(BaseModel):
+class McpTool(msgspec.Struct):
     """A tool available from the MCP server."""
     name: str
     description: Optional[str] = None
     input_schema: Optional[dict[str, Any]] = None
 
 
-class McpContent(BaseModel):
+class McpContent(msgspec.Struct):
     """Content returned from an MCP tool call."""
     type: str
     text: Optional[str] = None
 
 
-class McpToolResult(BaseModel):
+class McpToolResult(msgspec.Struct):
     """Result of an MCP tool call."""
     content: list[McpContent]
     is_error: bool = False
 
 
-# SSE Event Types
-class EventType(str, Enum):
-    """Types of events sent to the client."""
-    THINKING = "thinking"
-    TOOL_START = "tool_start"
-    TOOL_COMPLETE = "tool_complete"
-    TOOL_ERROR = "tool_error"
-    RESPONSE = "response"
-    ERROR = "error"
-    DONE = "done"
+# SSE Event Types (plain strings, so building an event does no enum lookup)
+THINKING = "thinking"
+TOOL_START = "tool_start"
+TOOL_COMPLETE = "tool_complete"
+TOOL_ERROR = "tool_error"
+RESPONSE = "response"
+ERROR = "error"
+DONE = "done"
+
+EventType = Literal[
+    "thinking",
+    "tool_start",
+    "tool_complete",
+    "tool_error",
+    "response",
+    "error",
+    "done",
+]
 
 
-class OrchestratorEvent(BaseModel):
+class OrchestratorEvent(msgspec.Struct):
     """Event sent to the client during chat processing."""
     type: EventType
     text: Optional[str] = None
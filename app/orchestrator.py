@@ -1,7 +1,10 @@
 """Chat Orchestrator - Core AI + MCP tool calling loop."""
+import asyncio
 import logging
 from typing import AsyncGenerator
 
+from cachetools import TTLCache
+
 from app.mcp_client import McpClient
 from app.llm_client import (
     LlmClient,
@@ -13,14 +16,26 @@ from app.models import (
     ChatMessage,
     MessageRole,
     OrchestratorEvent,
-    EventType,
     ToolCall,
+    THINKING,
+    TOOL_START,
+    TOOL_COMPLETE,
+    TOOL_ERROR,
+    RESPONSE,
+    ERROR,
+    DONE,
 )
 
 logger = logging.getLogger(__name__)
 
 MAX_TOOL_ITERATIONS = 10
 
+# Final answers are reused for identical questions asked in the same recent
+# context; the TTL is short because answers include live train data
+RESPONSE_CACHE_SIZE = 1024
+RESPONSE_CACHE_TTL = 60
+RESPONSE_CACHE_HISTORY = 4
+
 
 class ChatOrchestrator:
     """
@@ -37,6 +52,9 @@ class ChatOrchestrator:
     def __init__(self):
         self.mcp_client = McpClient()
         self.llm_client = LlmClient()
+        self._response_cache: TTLCache = TTLCache(
+            maxsize=RESPONSE_CACHE_SIZE, ttl=RESPONSE_CACHE_TTL
+        )
 
     async def process_message(
         self,
@@ -56,45 +74,83 @@ class ChatOrchestrator:
         try:
             # Emit thinking event
             yield OrchestratorEvent(
-                type=EventType.THINKING,
+                type=THINKING,
                 text="Analyzing your request...",
             )
 
-            # Initialize MCP and get tools
-            await self.mcp_client.initialize()
+            cache_key = (
+                user_message,
+                tuple(
+                    (m.role, m.content)
+                    for m in history[-RESPONSE_CACHE_HISTORY:]
+                ),
+            )
+            cached_text = self._response_cache.get(cache_key)
+            if cached_text is not None:
+                logger.debug("Serving response from cache")
+                yield OrchestratorEvent(type=RESPONSE, text=cached_text)
+                yield OrchestratorEvent(type=DONE)
+                return
+
+            # Get tools (MCP is warmed up at startup; this initializes lazily
+            # only if that failed)
             tools = await self.mcp_client.list_tools()
 
-            logger.info(f"Initialized with {len(tools)} tools")
+            logger.debug("Using %s tools", len(tools))
 
-            # Build conversation with user message
-            messages = list(history)
-            messages.append(
-                ChatMessage(role=MessageRole.USER, content=user_message)
-            )
+            # Build conversation with user message (the caller's history is
+            # left untouched; the tool loop appends to this list in place)
+            messages = [
+                *history,
+                ChatMessage(role=MessageRole.USER, content=user_message),
+            ]
+
+            # OpenAI-format messages, extended incrementally by the LLM client
+            openai_messages: list[dict] = []
+
+            # Answers built on failed tool calls are not cached
+            tool_failed = False
+
+            # Everything streamed as RESPONSE text; text the LLM sends with
+            # tool calls is kept apart from the next turn's text by a blank line
+            response_parts: list[str] = []
+            needs_separator = False
 
             # Tool calling loop
             iterations = 0
             while iterations < MAX_TOOL_ITERATIONS:
                 iterations += 1
-                logger.debug(f"Tool calling iteration {iterations}")
-
-                # Send to LLM
-                llm_response = await self.llm_client.chat(messages, tools)
+                logger.debug("Tool calling iteration %s", iterations)
+
+                # Send to LLM, forwarding text deltas as they stream in
+                llm_response = None
+                async for item in self.llm_client.chat(
+                    messages, tools, openai_messages
+                ):
+                    if isinstance(item, str):
+                        if needs_separator:
+                            item = "\n\n" + item
+                            needs_separator = False
+                        response_parts.append(item)
+                        yield OrchestratorEvent(
+                            type=RESPONSE,
+                            text=item,
+                        )
+                    else:
+                        llm_response = item
 
                 if isinstance(llm_response, LlmError):
                     yield OrchestratorEvent(
-                        type=EventType.ERROR,
+                        type=ERROR,
                         text=f"AI error: {llm_response.message}",
                     )
                     return
 
                 if isinstance(llm_response, TextResponse):
-                    # LLM returned final response
-                    yield OrchestratorEvent(
-                        type=EventType.RESPONSE,
-                        text=llm_response.text,
-                    )
-                    yield OrchestratorEvent(type=EventType.DONE)
+                    # LLM finished its response; the text was already streamed
+                    if not tool_failed:
+                        self._response_cache[cache_key] = "".join(response_parts)
+                    yield OrchestratorEvent(type=DONE)
                     return
 
                 if isinstance(llm_response, ToolCallsResponse):
@@ -106,87 +162,87 @@ class ChatOrchestrator:
                             id=tc.id,
                             name=tc.name,
                             arguments=tc.arguments,
+                            arguments_json=tc.arguments_json,
                         )
                         for tc in llm_response.tool_calls
                     ]
                     messages.append(
                         ChatMessage(
                             role=MessageRole.ASSISTANT,
-                            content="",
+                            content=llm_response.text,
                             tool_calls=tool_calls_for_message,
                         )
                     )
+                    if llm_response.text:
+                        needs_separator = True
 
-                    # Execute each tool call
+                    # Announce every tool call, then execute them concurrently
                     for tool_call in llm_response.tool_calls:
                         yield OrchestratorEvent(
-                            type=EventType.TOOL_START,
+                            type=TOOL_START,
                             name=tool_call.name,
                             args=tool_call.arguments,
                         )
 
-                        try:
-                            result = await self.mcp_client.call_tool(
+                    results = await asyncio.gather(
+                        *(
+                            self.mcp_client.call_tool(
                                 tool_call.name,
                                 tool_call.arguments,
                             )
+                            for tool_call in llm_response.tool_calls
+                        )
+                    )
 
-                            # Extract text from result
+                    # Report results in the order the LLM requested them
+                    for tool_call, result in zip(
+                        llm_response.tool_calls, results
+                    ):
+                        # Extract text from result; almost always a single
+                        # text item, so skip the join for that
+                        content = result.content
+                        if len(content) == 1 and content[0].text is not None:
+                            result_text = content[0].text
+                        elif not content:
+                            result_text = ""
+                        else:
                             result_text = "\n".join(
-                                c.text for c in result.content if c.text
+                                c.text for c in content if c.text
                             )
 
-                            if result.is_error:
-                                yield OrchestratorEvent(
-                                    type=EventType.TOOL_ERROR,
-                                    name=tool_call.name,
-                                    result=result_text,
-                                )
-                            else:
-                                yield OrchestratorEvent(
-                                    type=EventType.TOOL_COMPLETE,
-                                    name=tool_call.name,
-                                    result=result_text,
-                                )
-
-                            # Add tool result to messages
-                            messages.append(
-                                ChatMessage(
-                                    role=MessageRole.TOOL,
-                                    content=result_text,
-                                    tool_call_id=tool_call.id,
-                                )
+                        if result.is_error:
+                            tool_failed = True
+                            yield OrchestratorEvent(
+                                type=TOOL_ERROR,
+                                name=tool_call.name,
+                                result=result_text,
                             )
-
-                        except Exception as e:
-                            error_msg = f"Tool execution failed: {e}"
-                            logger.error(error_msg)
-
+                        else:
                             yield OrchestratorEvent(
-                                type=EventType.TOOL_ERROR,
+                                type=TOOL_COMPLETE,
                                 name=tool_call.name,
-                                result=error_msg,
+                                result=result_text,
                             )
 
-                            # Add error as tool result
-                            messages.append(
-                                ChatMessage(
-                                    role=MessageRole.TOOL,
-                                    content=error_msg,
-                                    tool_call_id=tool_call.id,
-                                )
+                        # Add tool result to messages
+                        messages.append(
+                            ChatMessage(
+                                role=MessageRole.TOOL,
+                                content=result_text,
+                                tool_call_id=tool_call.id,
                             )
+                        )
 
             # Max iterations reached
             yield OrchestratorEvent(
-                type=EventType.ERROR,
+                type=ERROR,
                 text="Maximum tool iterations reached. Please try again.",
             )
 
         except Exception as e:
-            logger.exception(f"Orchestrator error: {e}")
+            logger.exception("Orchestrator error: %s", e)
             yield OrchestratorEvent(
-                type=EventType.ERROR,
+                type=ERROR,
                 text=f"An error occurred: {e}",
             )
 